@@ -8,33 +8,190 @@
 - Разделении на позитивные и негативные сценарии
 - Статистике по каждому типу тестов
 """
-import subprocess
-import json
+import contextlib
+import io
+import os
+import pickle
+import re
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
 import sys
 
 
-def run_command(cmd: List[str]) -> Tuple[str, int]:
-    """Выполняет команду и возвращает вывод и код возврата."""
+try:
+    from lxml import etree as _LXML_ETREE
+except ImportError:
+    _LXML_ETREE = None
+    _XPATH_TESTSUITES = None
+else:
+    # Все <testsuite> внутри корневого элемента
+    _XPATH_TESTSUITES = _LXML_ETREE.XPath("/*//testsuite")
+
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_TESTS_DIR = _PROJECT_ROOT / "tests"
+_REPORTS_DIR = _PROJECT_ROOT / "reports"
+
+# Шаблоны компилируются один раз при импорте, а не на каждый файл
+_RE_DEF_TEST = re.compile(rb"def test_")
+_RE_SMOKE = re.compile(rb"@pytest\.mark\.smoke")
+_RE_USER_CLASS = re.compile(rb"class\s+\w+User\s*\(.*?HttpUser")
+
+
+CATEGORIES = ("api", "integration", "contract", "performance")
+
+# Число потоков для чтения файлов: работа ограничена вводом-выводом,
+# поэтому потоков может быть больше, чем ядер
+_READ_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+class FileStats(NamedTuple):
+    """Результат разбора одного тестового файла."""
+    test_count: int
+    file_count: int
+    positive: int
+    negative: int
+    smoke: bool
+
+
+def _iter_py_files(root: str) -> Iterator[os.DirEntry]:
+    """
+    Рекурсивно возвращает DirEntry всех *.py файлов внутри root.
+
+    Использует os.scandir вместо Path.rglob: метаданные DirEntry кешируются,
+    поэтому на каждый файл приходится меньше системных вызовов stat().
+    """
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
-        return result.stdout + result.stderr, result.returncode
-    except Exception as e:
-        return str(e), 1
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    # В __pycache__ и скрытых директориях тестов нет
+                    if entry.name != "__pycache__" and not entry.name.startswith("."):
+                        yield from _iter_py_files(entry.path)
+                elif entry.is_file(follow_symlinks=False) and entry.name.endswith(".py"):
+                    yield entry
+    except OSError:
+        return
+
 
+def _read_bytes(path: str) -> bytes:
+    """Читает файл целиком одним вызовом read()."""
+    with open(path, "rb") as f:
+        return f.read()
 
-def count_tests_by_marker() -> Dict[str, int]:
-    """Подсчитывает количество тестов по маркерам."""
-    import re
+
+# Кеш статистики файлов по ключу (путь, mtime_ns, размер).
+# Сохраняется между запусками в reports/.count_cache.pkl
+_STATS_CACHE: Dict[Tuple[str, int, int], FileStats] = {}
+
+
+def load_stats_cache(cache_path: Path) -> None:
+    """Загружает сохраненный кеш статистики файлов, если он есть."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached = pickle.load(f)
+        _STATS_CACHE.update((key, FileStats(*value)) for key, value in cached.items())
+    except Exception:
+        # Отсутствующий или поврежденный кеш просто игнорируется
+        pass
+
+
+def save_stats_cache(cache_path: Path) -> None:
+    """Сохраняет кеш статистики, отбрасывая записи для измененных файлов."""
+    fresh = {}
+    for (path, mtime_ns, size), stats in _STATS_CACHE.items():
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        if (st.st_mtime_ns, st.st_size) == (mtime_ns, size):
+            # Храним обычные кортежи, чтобы кеш не зависел от имени модуля
+            fresh[(path, mtime_ns, size)] = tuple(stats)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(fresh, f)
+    except OSError:
+        pass
+
+
+def _collect_stats(paths: List[str]) -> List[Optional[FileStats]]:
+    """
+    Возвращает статистику для списка файлов.
+
+    Файлы, которых нет в кеше, сначала читаются параллельно пачкой
+    (чтение отпускает GIL), а затем разбираются последовательно.
+    Для нечитаемых файлов возвращается None.
+    """
+    keys: List[Optional[Tuple[str, int, int]]] = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            keys.append(None)
+            continue
+        keys.append((path, st.st_mtime_ns, st.st_size))
+    
+    missing = [key for key in keys if key is not None and key not in _STATS_CACHE]
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(missing))) as executor:
+            contents = list(executor.map(_safe_read_bytes, [key[0] for key in missing]))
+        for key, content in zip(missing, contents):
+            if content is not None:
+                _STATS_CACHE[key] = _parse_content(content)
     
+    return [_STATS_CACHE.get(key) if key is not None else None for key in keys]
+
+
+def _safe_read_bytes(path: str) -> Optional[bytes]:
+    """Как _read_bytes, но возвращает None, если файл не удалось прочитать."""
+    try:
+        return _read_bytes(path)
+    except OSError:
+        return None
+
+
+def _parse_content(content: bytes) -> FileStats:
+    """Разбирает содержимое тестового файла."""
+    test_count = len(_RE_DEF_TEST.findall(content))
+    
+    # Подсчет позитивных/негативных тестов за один проход:
+    # считаем все def test_ после class.*Positive / class.*Negative
+    positive = negative = 0
+    in_positive_class = in_negative_class = False
+    for line in content.splitlines():
+        if b"class" in line:
+            in_positive_class = b"Positive" in line
+            in_negative_class = b"Negative" in line
+        if b"def test_" in line:
+            if in_positive_class:
+                positive += 1
+            if in_negative_class:
+                negative += 1
+    
+    # Подсчитываем функции test_* и методы test_*
+    file_count = content.count(b"def test_") + content.count(b"    def test_")
+    
+    return FileStats(
+        test_count=test_count,
+        file_count=file_count,
+        positive=positive,
+        negative=negative,
+        smoke=_RE_SMOKE.search(content) is not None,
+    )
+
+
+def scan_all(tests_dir: Path) -> Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]:
+    """
+    Собирает статистику по тестам за один обход директории.
+
+    Каждый test_*.py читается не более одного раза.
+
+    Returns:
+        Кортеж (маркеры, файлы по категориям, количество тестов по категориям)
+    """
     markers = {
         "api": 0,
         "integration": 0,
@@ -43,70 +200,181 @@ def count_tests_by_marker() -> Dict[str, int]:
         "negative": 0,
         "smoke": 0,
     }
+    test_files: Dict[str, List[str]] = {category: [] for category in CATEGORIES}
+    category_counts: Dict[str, int] = {category: 0 for category in CATEGORIES}
+    category_dirs = {os.path.join(tests_dir, category): category for category in CATEGORIES}
+    
+    # Сначала собираем список файлов, затем получаем статистику для всех сразу
+    scanned: List[Tuple[str, Optional[str]]] = []
+    for entry in _iter_py_files(str(tests_dir)):
+        category = category_dirs.get(os.path.dirname(entry.path))
+        
+        if category == "performance":
+            # Для performance также включаем locustfile.py
+            if entry.name != "__init__.py":
+                test_files[category].append(entry.name)
+        elif category is not None and entry.name.startswith("test_"):
+            test_files[category].append(entry.name)
+        
+        if entry.name.startswith("test_"):
+            scanned.append((entry.path, category))
     
-    # Подсчет тестов через анализ файлов
-    tests_dir = Path(__file__).parent.parent / "tests"
+    results = _collect_stats([path for path, _ in scanned])
     
-    for test_file in tests_dir.rglob("test_*.py"):
-        try:
-            content = test_file.read_text(encoding="utf-8")
-            test_count = len(re.findall(r'def test_', content))
-            
-            # Определяем категорию по пути
-            if "api" in str(test_file):
-                markers["api"] += test_count
-            elif "integration" in str(test_file):
-                markers["integration"] += test_count
-            elif "contract" in str(test_file):
-                markers["contract"] += test_count
-            
-            # Подсчет позитивных/негативных тестов
-            if "Positive" in content or "@pytest.mark.positive" in content:
-                # Находим все тесты в классах Positive
-                positive_tests = re.findall(r'(?:class.*Positive.*?|@pytest\.mark\.positive.*?)(?:def test_\w+)', content, re.DOTALL)
-                # Более простой способ - считать тесты в файлах с Positive в названии класса
-                if "Positive" in content:
-                    # Считаем все def test_ после class.*Positive
-                    positive_count = 0
-                    in_positive_class = False
-                    for line in content.split('\n'):
-                        if 'class' in line and 'Positive' in line:
-                            in_positive_class = True
-                        elif 'class' in line and 'Positive' not in line and in_positive_class:
-                            in_positive_class = False
-                        if in_positive_class and 'def test_' in line:
-                            positive_count += 1
-                    markers["positive"] += positive_count
-            
-            if "Negative" in content or "@pytest.mark.negative" in content:
-                # Аналогично для негативных
-                negative_count = 0
-                in_negative_class = False
-                for line in content.split('\n'):
-                    if 'class' in line and 'Negative' in line:
-                        in_negative_class = True
-                    elif 'class' in line and 'Negative' not in line and in_negative_class:
-                        in_negative_class = False
-                    if in_negative_class and 'def test_' in line:
-                        negative_count += 1
-                markers["negative"] += negative_count
-            
-            if "@pytest.mark.smoke" in content:
-                markers["smoke"] += test_count
-        except Exception:
+    for (path, category), stats in zip(scanned, results):
+        if stats is None:
             continue
+        
+        # Определяем категорию по пути
+        if "api" in path:
+            markers["api"] += stats.test_count
+        elif "integration" in path:
+            markers["integration"] += stats.test_count
+        elif "contract" in path:
+            markers["contract"] += stats.test_count
+        
+        markers["positive"] += stats.positive
+        markers["negative"] += stats.negative
+        if stats.smoke:
+            markers["smoke"] += stats.test_count
+        
+        if category is not None and category != "performance":
+            category_counts[category] += stats.file_count
     
-    return markers
+    return markers, test_files, category_counts
+
+
+class _CollectionRecorder:
+    """Плагин pytest, запоминающий собранные тесты и их маркеры."""
+
+    def __init__(self):
+        self.items: List[Tuple[str, FrozenSet[str]]] = []
+
+    def pytest_collection_finish(self, session):
+        self.items = [
+            (item.nodeid, frozenset(marker.name for marker in item.iter_markers()))
+            for item in session.items
+        ]
+
+
+def collect_pytest_items() -> Optional[Tuple[Tuple[str, FrozenSet[str]], ...]]:
+    """
+    Собирает тесты средствами самого pytest (--collect-only).
+
+    В отличие от анализа исходников, учитывает parametrize и маркеры,
+    унаследованные от классов.
+
+    Returns:
+        Кортеж пар (nodeid, маркеры) или None, если сбор не удался
+    """
+    try:
+        import pytest
+    except ImportError:
+        return None
+    
+    if str(_PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(_PROJECT_ROOT))
+    
+    recorder = _CollectionRecorder()
+    # addopts сбрасываются, чтобы сбор не перезаписал reports/junit.xml
+    args = [
+        "--collect-only",
+        "-q",
+        "-p", "no:cacheprovider",
+        "-o", "addopts=",
+        "--rootdir", str(_PROJECT_ROOT),
+        str(_TESTS_DIR),
+    ]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            exit_code = pytest.main(args, plugins=[recorder])
+    except Exception:
+        return None
+    
+    if exit_code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+        return None
+    return tuple(recorder.items)
+
+
+def summarize_collected(
+    items: Tuple[Tuple[str, FrozenSet[str]], ...]
+) -> Tuple[Dict[str, int], Dict[str, List[str]], Dict[str, int]]:
+    """
+    Считает тесты по маркерам и категориям по результатам сбора pytest.
+
+    Позитивные и негативные сценарии определяются по маркерам positive/negative
+    каждого собранного теста, а не по именам классов в исходниках.
+
+    Returns:
+        Кортеж (маркеры, файлы по категориям, количество тестов по категориям)
+        в том же виде, что и у scan_all
+    """
+    markers = {
+        "api": 0,
+        "integration": 0,
+        "contract": 0,
+        "positive": 0,
+        "negative": 0,
+        "smoke": 0,
+    }
+    test_files: Dict[str, List[str]] = {category: [] for category in CATEGORIES}
+    category_counts: Dict[str, int] = {category: 0 for category in CATEGORIES}
+    
+    for nodeid, item_markers in items:
+        for marker in item_markers & markers.keys():
+            markers[marker] += 1
+        
+        # nodeid имеет вид tests/<категория>/test_*.py::Class::test_name
+        parts = nodeid.split("::", 1)[0].split("/")
+        if len(parts) == 3 and parts[0] == "tests" and parts[1] in CATEGORIES:
+            category = parts[1]
+            category_counts[category] += 1
+            if parts[2] not in test_files[category]:
+                test_files[category].append(parts[2])
+    
+    # Нагрузочные сценарии pytest не собирает: файлы берем из директории
+    performance_dir = _TESTS_DIR / "performance"
+    if performance_dir.is_dir():
+        test_files["performance"] = sorted(
+            entry.name for entry in _iter_py_files(str(performance_dir))
+            if entry.name != "__init__.py"
+            and os.path.dirname(entry.path) == str(performance_dir)
+        )
+    
+    return markers, test_files, category_counts
+
+
+def _iter_testsuites(junit_path: Path) -> Iterator:
+    """
+    Возвращает элементы <testsuite> из JUnit XML, кроме корневого.
+
+    Корневой элемент не учитывается, как и в findall(".//testsuite").
+    """
+    if _LXML_ETREE is not None:
+        # Скомпилированный XPath выполняется целиком в C
+        yield from _XPATH_TESTSUITES(_LXML_ETREE.parse(str(junit_path)))
+        return
+    
+    # Потоковый разбор: обрабатываем только закрывающиеся <testsuite>
+    # и сразу освобождаем их поддеревья, не строя весь DOM в памяти
+    root = None
+    for event, elem in ET.iterparse(junit_path, events=("start", "end")):
+        if root is None:
+            root = elem
+        if event != "end" or elem.tag != "testsuite" or elem is root:
+            continue
+        yield elem
+        elem.clear()
 
 
 def parse_junit_xml() -> Dict[str, any]:
     """Парсит JUnit XML отчет."""
     # Сначала пытаемся найти all-junit.xml (полный отчет всех тестов)
-    junit_path = Path(__file__).parent.parent / "reports" / "all-junit.xml"
+    junit_path = _REPORTS_DIR / "all-junit.xml"
     
     # Если нет, используем обычный junit.xml
     if not junit_path.exists():
-        junit_path = Path(__file__).parent.parent / "reports" / "junit.xml"
+        junit_path = _REPORTS_DIR / "junit.xml"
     
     if not junit_path.exists():
         return {
@@ -118,21 +386,22 @@ def parse_junit_xml() -> Dict[str, any]:
         }
     
     try:
-        tree = ET.parse(junit_path)
-        root = tree.getroot()
-        
         total = 0
         passed = 0
         failed = 0
         skipped = 0
         errors = 0
         
-        for testsuite in root.findall(".//testsuite"):
-            total += int(testsuite.get("tests", 0))
-            passed += int(testsuite.get("tests", 0)) - int(testsuite.get("failures", 0)) - int(testsuite.get("errors", 0)) - int(testsuite.get("skipped", 0))
-            failed += int(testsuite.get("failures", 0))
-            skipped += int(testsuite.get("skipped", 0))
-            errors += int(testsuite.get("errors", 0))
+        for testsuite in _iter_testsuites(junit_path):
+            tests = int(testsuite.get("tests", 0))
+            suite_failures = int(testsuite.get("failures", 0))
+            suite_errors = int(testsuite.get("errors", 0))
+            suite_skipped = int(testsuite.get("skipped", 0))
+            total += tests
+            passed += tests - suite_failures - suite_errors - suite_skipped
+            failed += suite_failures
+            skipped += suite_skipped
+            errors += suite_errors
         
         return {
             "total": total,
@@ -152,79 +421,37 @@ def parse_junit_xml() -> Dict[str, any]:
         }
 
 
-def collect_test_files() -> Dict[str, List[str]]:
-    """Собирает информацию о тестовых файлах."""
-    tests_dir = Path(__file__).parent.parent / "tests"
-    
-    categories = {
-        "api": [],
-        "integration": [],
-        "contract": [],
-        "performance": []
-    }
-    
-    for category in categories.keys():
-        category_dir = tests_dir / category
-        if category_dir.exists():
-            if category == "performance":
-                # Для performance также включаем locustfile.py
-                for test_file in category_dir.glob("*.py"):
-                    if test_file.name != "__init__.py":
-                        categories[category].append(test_file.name)
-            else:
-                for test_file in category_dir.glob("test_*.py"):
-                    categories[category].append(test_file.name)
-    
-    return categories
-
-
-def count_tests_in_file(file_path: Path) -> int:
-    """Подсчитывает количество тестов в файле."""
-    try:
-        content = file_path.read_text(encoding="utf-8")
-        # Подсчитываем функции test_* и методы test_*
-        test_functions = content.count("def test_")
-        test_methods = content.count("    def test_")
-        return test_functions + test_methods
-    except Exception:
-        return 0
+def _file_list(files: List[str]) -> str:
+    """Форматирует имена файлов как вложенный markdown-список."""
+    return "\n".join(f"  - `{f}`" for f in files)
 
 
 def generate_report() -> str:
     """Генерирует отчет о покрытии."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Собираем статистику
-    markers = count_tests_by_marker()
+    # Если pytest доступен, точные значения берем из его сбора тестов,
+    # а анализ исходников выполняется только как запасной вариант
+    collected = collect_pytest_items()
+    if collected is not None:
+        markers, test_files, category_counts = summarize_collected(collected)
+    else:
+        markers, test_files, category_counts = scan_all(_TESTS_DIR)
     junit_stats = parse_junit_xml()
-    test_files = collect_test_files()
     
-    # Подсчитываем тесты по категориям
-    tests_dir = Path(__file__).parent.parent / "tests"
-    category_counts = {}
-    for category in ["api", "integration", "contract", "performance"]:
-        category_dir = tests_dir / category
-        count = 0
-        if category_dir.exists():
-            if category == "performance":
-                # Для нагрузочных тестов считаем классы пользователей в locustfile.py
-                locust_file = category_dir / "locustfile.py"
-                if locust_file.exists():
-                    try:
-                        content = locust_file.read_text(encoding="utf-8")
-                        # Ищем классы, наследующиеся от HttpUser
-                        import re
-                        user_classes = re.findall(r'class\s+\w+User\s*\(.*?HttpUser', content)
-                        count = len(user_classes)
-                    except Exception:
-                        count = 0
-            else:
-                for test_file in category_dir.glob("test_*.py"):
-                    count += count_tests_in_file(test_file)
-        category_counts[category] = count
+    # Для нагрузочных тестов считаем классы пользователей в locustfile.py
+    locust_file = _TESTS_DIR / "performance" / "locustfile.py"
+    if locust_file.exists():
+        try:
+            content = _read_bytes(str(locust_file))
+            # Ищем классы, наследующиеся от HttpUser
+            category_counts["performance"] = len(_RE_USER_CLASS.findall(content))
+        except Exception:
+            category_counts["performance"] = 0
     
-    # Генерируем отчет
-    report = f"""# Отчет о покрытии тестами
+    # Генерируем отчет по частям и склеиваем один раз в конце
+    parts = []
+    parts.append(f"""# Отчет о покрытии тестами
 
 **Дата генерации:** {timestamp}
 
@@ -237,53 +464,53 @@ def generate_report() -> str:
 | Провалено | {junit_stats['failed']} |
 | Пропущено | {junit_stats['skipped']} |
 | Ошибок | {junit_stats['errors']} |
-
-## Покрытие по категориям тестов
-
-### API Тесты
+""")
+    parts.append("""## Покрытие по категориям тестов
+""")
+    parts.append(f"""### API Тесты
 - **Количество тестов:** {category_counts.get('api', 0)}
 - **Файлы тестов:** {len(test_files.get('api', []))}
-  {chr(10).join(f'  - `{f}`' for f in test_files.get('api', []))}
+{_file_list(test_files.get('api', []))}
 
 **Покрытие:**
 - Позитивные сценарии: {markers.get('positive', 0)} тестов
 - Негативные сценарии: {markers.get('negative', 0)} тестов
 - Smoke тесты: {markers.get('smoke', 0)} тестов
-
-### Интеграционные тесты
+""")
+    parts.append(f"""### Интеграционные тесты
 - **Количество тестов:** {category_counts.get('integration', 0)}
 - **Файлы тестов:** {len(test_files.get('integration', []))}
-  {chr(10).join(f'  - `{f}`' for f in test_files.get('integration', []))}
+{_file_list(test_files.get('integration', []))}
 
 **Покрытие:**
 - Полные сценарии работы приложения
 - Интеграция с внешними сервисами
 - Проверка состояния между запросами
 - Параллельные запросы
-
-### Контрактные тесты
+""")
+    parts.append(f"""### Контрактные тесты
 - **Количество тестов:** {category_counts.get('contract', 0)}
 - **Файлы тестов:** {len(test_files.get('contract', []))}
-  {chr(10).join(f'  - `{f}`' for f in test_files.get('contract', []))}
+{_file_list(test_files.get('contract', []))}
 
 **Покрытие:**
 - Валидация структуры запросов и ответов
 - Проверка HTTP статус кодов
 - Валидация Content-Type
 - Проверка формата JSON
-
-### Нагрузочные тесты
+""")
+    parts.append(f"""### Нагрузочные тесты
 - **Количество сценариев:** {category_counts.get('performance', 0)}
 - **Файлы тестов:** {len(test_files.get('performance', []))}
-  {chr(10).join(f'  - `{f}`' for f in test_files.get('performance', []))}
+{_file_list(test_files.get('performance', []))}
 
 **Покрытие:**
 - Обычная нагрузка (SpringBootUser)
 - Негативные сценарии под нагрузкой (SpringBootNegativeUser)
 - Скачки нагрузки (SpringBootSpikeUser)
 - Стресс-тестирование (SpringBootStressUser)
-
-## Позитивные и негативные сценарии
+""")
+    parts.append(f"""## Позитивные и негативные сценарии
 
 ### Позитивные сценарии
 Тесты, проверяющие успешное выполнение операций:
@@ -310,8 +537,8 @@ def generate_report() -> str:
 - Состояния гонки (race conditions)
 
 **Количество:** {markers.get('negative', 0)} тестов
-
-## Покрытие функциональности
+""")
+    parts.append("""## Покрытие функциональности
 
 ### Эндпоинт /endpoint
 
@@ -409,21 +636,22 @@ locust -f locustfile.py --host=http://localhost:8080
 ---
 
 *Отчет сгенерирован автоматически скриптом `scripts/generate_coverage_report.py`*
-"""
-    
-    return report
+""")
+
+    return "\n".join(parts)
 
 
 def main():
     """Главная функция."""
-    project_root = Path(__file__).parent.parent
-    reports_dir = project_root / "reports"
-    reports_dir.mkdir(exist_ok=True)
+    _REPORTS_DIR.mkdir(exist_ok=True)
     
-    report_path = reports_dir / "coverage.md"
+    report_path = _REPORTS_DIR / "coverage.md"
+    cache_path = _REPORTS_DIR / ".count_cache.pkl"
     
     print("Генерация отчета о покрытии тестами...")
+    load_stats_cache(cache_path)
     report = generate_report()
+    save_stats_cache(cache_path)
     
     report_path.write_text(report, encoding="utf-8")
     print(f"Отчет сохранен в: {report_path}")
@@ -1,8 +1,17 @@
 """
 Утилиты для генерации токенов.
 """
+import itertools
 import random
+import re
+import secrets
 import string
+from typing import Iterator
+
+_ALPHABET = string.ascii_uppercase + string.digits
+
+# Формат токена, который принимает приложение
+_TOKEN_RE = re.compile(r"[A-Z0-9]{32}")
 
 
 def generate_token(length: int = 32) -> str:
@@ -15,8 +24,20 @@ def generate_token(length: int = 32) -> str:
     Returns:
         Сгенерированный токен
     """
-    characters = string.ascii_uppercase + string.digits
-    return "".join(random.choice(characters) for _ in range(length))
+    return "".join(random.choices(_ALPHABET, k=length))
+
+
+def is_valid_token(token: str) -> bool:
+    """
+    Проверяет, что токен соответствует формату приложения (32 символа A-Z0-9).
+
+    Args:
+        token: Проверяемый токен
+
+    Returns:
+        True, если формат токена корректен
+    """
+    return _TOKEN_RE.fullmatch(token) is not None
 
 
 def generate_hex_token(length: int = 32) -> str:
@@ -29,5 +50,39 @@ def generate_hex_token(length: int = 32) -> str:
     Returns:
         Сгенерированный токен в hex формате
     """
-    characters = string.digits + "ABCDEF"
-    return "".join(random.choice(characters) for _ in range(length))
+    return secrets.token_hex((length + 1) // 2)[:length].upper()
+
+
+def make_token(prefix: str, length: int = 32) -> str:
+    """
+    Генерирует токен заданной длины, начинающийся с префикса.
+
+    Args:
+        prefix: Префикс токена (символы 0-9A-F, чтобы токен оставался hex)
+        length: Полная длина токена с префиксом (по умолчанию 32)
+
+    Returns:
+        Префикс, дополненный случайными hex символами до длины length
+    """
+    return prefix + generate_hex_token(length - len(prefix))
+
+
+def iter_hex_tokens(length: int = 32, prefix: str = "") -> Iterator[str]:
+    """
+    Бесконечный поток уникальных токенов: prefix и hex символы (0-9A-F).
+
+    Случайная hex часть генерируется один раз, к ней дописывается счетчик.
+    Токены не повторяются ни внутри прогона, ни между прогонами.
+
+    Args:
+        length: Длина токена (по умолчанию 32)
+        prefix: Постоянное начало токенов (например, префикс воркера xdist).
+            Токены целиком в формате 0-9A-F, только если префикс тоже hex
+
+    Yields:
+        Очередной токен
+    """
+    prefix = make_token(prefix, length // 2)
+    width = length - len(prefix)
+    for i in itertools.count():
+        yield f"{prefix}{i:0{width}X}"
@@ -1,16 +1,46 @@
 """
 Pydantic модели для валидации ответов от Spring Boot API.
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
+from typing import Any, Dict, Literal
 
 
 class SuccessResponse(BaseModel):
     """Модель успешного ответа."""
-    result: str = Field(default="OK", pattern="^OK$")
+    result: Literal["OK"] = "OK"
 
 
 class ErrorResponse(BaseModel):
     """Модель ответа с ошибкой."""
-    result: str = Field(default="ERROR", pattern="^ERROR$")
+    result: Literal["ERROR"] = "ERROR"
     message: str
+
+
+# Валидаторы строятся один раз при импорте и переиспользуются
+SUCCESS_ADAPTER = TypeAdapter(SuccessResponse)
+ERROR_ADAPTER = TypeAdapter(ErrorResponse)
+
+
+def expect_ok(response: Dict[str, Any]) -> SuccessResponse:
+    """
+    Проверяет, что ответ API успешный, и возвращает провалидированную модель.
+
+    Raises:
+        AssertionError: Если result != "OK"
+        ValidationError: Если ответ не соответствует SuccessResponse
+    """
+    assert response.get("result") == "OK", response
+    return SUCCESS_ADAPTER.validate_python(response)
+
+
+def expect_error(response: Dict[str, Any]) -> ErrorResponse:
+    """
+    Проверяет, что ответ API - ошибка с непустым сообщением, и возвращает модель.
+
+    Raises:
+        AssertionError: Если result != "ERROR" или сообщение пустое
+        ValidationError: Если ответ не соответствует ErrorResponse
+    """
+    assert response.get("result") == "ERROR", response
+    assert response.get("message"), response
+    return ERROR_ADAPTER.validate_python(response)
@@ -1,46 +1,54 @@
 """
 Конфигурация для API тестов.
+
+Общие фикстуры (config, api_client, fresh_token и др.) определены в tests/conftest.py.
 """
+import httpx
 import pytest
-import yaml
-from pathlib import Path
+from typing import Iterator, List
 from src.test_framework.clients.api_client import ApiClient
 
 
-def load_config() -> dict:
-    """Загружает конфигурацию из local.yaml."""
-    import os
-    config_path = Path(__file__).parent.parent.parent / "config" / "environments" / "local.yaml"
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    
-    # Переопределение URL для Docker окружения
-    if os.getenv("APP_URL"):
-        config["app"]["base_url"] = os.getenv("APP_URL")
-    if os.getenv("MOCK_URL"):
-        config["mock"]["base_url"] = os.getenv("MOCK_URL")
-    
-    return config
+@pytest.fixture(scope="class")
+def logged_in_token(api_client: ApiClient, token_pool: Iterator[str]) -> Iterator[str]:
+    """
+    Токен, прошедший LOGIN, общий для тестов одного класса.
+
+    После завершения тестов класса для токена выполняется LOGOUT.
+    """
+    token = next(token_pool)
+    response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+    assert response["result"] == "OK", f"LOGIN failed: {response}"
+    yield token
+    api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+
 
+@pytest.fixture
+def mocked_endpoint() -> List[httpx.Request]:
+    """Запросы, полученные имитацией /endpoint в текущем тесте."""
+    return []
 
-@pytest.fixture(scope="session")
-def config() -> dict:
-    """Конфигурация тестового окружения."""
-    return load_config()
 
+@pytest.fixture
+def mocked_api_client(
+    config: dict,
+    mocked_endpoint: List[httpx.Request]
+) -> Iterator[ApiClient]:
+    """
+    Клиент, запросы которого обрабатываются в процессе, без обращения к серверу.
+
+    На любой запрос возвращается один и тот же ответ с ошибкой: проверяется
+    только то, что клиент отправил, а не логика валидации сервера.
+    """
+    def handler(request: httpx.Request) -> httpx.Response:
+        mocked_endpoint.append(request)
+        return httpx.Response(200, json={"result": "ERROR", "message": "Invalid token or action"})
 
-@pytest.fixture(scope="session")
-def api_client(config: dict) -> ApiClient:
-    """Клиент для работы с Spring Boot API."""
     app_config = config["app"]
-    return ApiClient(
+    client = ApiClient(
         base_url=app_config["base_url"],
         api_key=app_config["api_key"],
-        timeout=app_config.get("timeout", 30)
+        transport=httpx.MockTransport(handler)
     )
-
-
-@pytest.fixture(scope="session")
-def mock_base_url(config: dict) -> str:
-    """Базовый URL mock-сервиса."""
-    return config["mock"]["base_url"]
+    yield client
+    client.close()
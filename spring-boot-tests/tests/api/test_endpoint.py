@@ -5,10 +5,38 @@ API тесты для эндпоинта /endpoint.
 - Позитивные сценарии (positive): проверка успешной работы API
 - Негативные сценарии (negative): проверка обработки ошибок и валидации
 """
+import httpx
+import json
 import pytest
-import requests
-from src.test_framework.fixtures.token import generate_hex_token, generate_token
-from src.test_framework.models.response import SuccessResponse, ErrorResponse
+import re
+from pathlib import Path
+from typing import Final
+from urllib.parse import urlencode
+from src.test_framework.fixtures.token import generate_hex_token
+from src.test_framework.models.response import expect_ok, expect_error
+
+# Невалидные токены для негативных тестов
+LOWERCASE_TOKEN: Final[str] = "0123456789abcdef0123456789abcdef"
+SPECIAL_CHARS_TOKEN: Final[str] = "0123456789abcdef0123456789@#$%"
+WHITESPACE_TOKEN: Final[str] = "0123456789ABCDEF0123456789ABCDEF "
+SQLI_TOKEN: Final[str] = "'; DROP TABLE tokens; --"
+XSS_TOKEN: Final[str] = "<script>alert('xss')</script>"
+
+# Стаб WireMock для /auth, отвечающий успехом на валидный токен
+AUTH_SUCCESS_STUB: Final[Path] = (
+    Path(__file__).parent.parent.parent / "config" / "wiremock" / "mappings" / "auth-success.json"
+)
+
+try:
+    import orjson
+
+    def json_body(token: str, action: str) -> bytes:
+        """Сериализует тело запроса в JSON."""
+        return orjson.dumps({"token": token, "action": action})
+except ImportError:
+    def json_body(token: str, action: str) -> bytes:
+        """Сериализует тело запроса в JSON."""
+        return json.dumps({"token": token, "action": action}, separators=(",", ":")).encode()
 
 
 @pytest.mark.api
@@ -17,85 +45,60 @@ from src.test_framework.models.response import SuccessResponse, ErrorResponse
 class TestEndpointPositive:
     """Позитивные тесты для основного эндпоинта приложения."""
 
-    def test_login_success(self, api_client, mock_base_url):
+    def test_login_success(self, api_client, mock_base_url, fresh_token):
         """
         Тест успешной аутентификации (LOGIN).
 
         Шаги:
-        1. Настроить WireMock для успешного ответа на /auth
+        1. Стаб WireMock для /auth загружается из config/wiremock/mappings
         2. Отправить запрос LOGIN с валидным токеном
         3. Проверить успешный ответ
         """
-        token = generate_hex_token(32)
+        response = api_client.endpoint(token=fresh_token, action="LOGIN")
 
-        # Настройка WireMock для успешного ответа
-        # В реальном тесте здесь будет настройка WireMock
-        # wiremock.stub_for(post(url_path_equal("/auth")).will_return(a_response().with_status(200)))
+        expect_ok(response)
 
-        response = api_client.endpoint(token=token, action="LOGIN")
-
-        assert response["result"] == "OK"
-        SuccessResponse(**response)
-
-    def test_login_without_mock(self, api_client):
+    def test_login_without_mock(self, api_client, fresh_token):
         """
         Тест LOGIN без mock-сервиса (ожидается ошибка).
 
         Проверяет, что приложение корректно обрабатывает отсутствие mock-сервиса.
         """
-        token = generate_hex_token(32)
-
-        # Если mock не настроен, приложение должно вернуть ошибку
-        try:
-            response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-            # Если запрос прошел, проверяем ответ
-            if response.get("result") == "ERROR":
-                ErrorResponse(**response)
-        except requests.exceptions.RequestException:
-            # Ожидаем ошибку соединения, если mock не запущен
-            pass
+        # Если mock не настроен, приложение должно вернуть ошибку.
+        # Недоступность самого приложения - провал теста, а не допустимый исход
+        response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
+        if response.get("result") == "ERROR":
+            expect_error(response)
 
-    def test_action_success_after_login(self, api_client, mock_base_url):
+    def test_action_success_after_login(self, api_client, mock_base_url, fresh_token):
         """
         Тест успешного выполнения действия (ACTION) после LOGIN.
 
         Шаги:
         1. Выполнить LOGIN
-        2. Настроить WireMock для успешного ответа на /doAction
+        2. Стаб WireMock для /doAction загружается из config/wiremock/mappings
         3. Отправить запрос ACTION
         4. Проверить успешный ответ
         """
-        token = generate_hex_token(32)
-
         # Сначала LOGIN
-        # wiremock.stub_for(post(url_path_equal("/auth")).will_return(a_response().with_status(200)))
-        # api_client.endpoint(token=token, action="LOGIN")
+        expect_ok(api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False))
 
         # Затем ACTION
-        # wiremock.stub_for(post(url_path_equal("/doAction")).will_return(a_response().with_status(200)))
-        response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
+        response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
 
-        # Может быть ошибка, если токен не был залогинен
-        if response.get("result") == "OK":
-            SuccessResponse(**response)
-        else:
-            ErrorResponse(**response)
+        expect_ok(response)
 
-    def test_action_without_login(self, api_client):
+    def test_action_without_login(self, api_client, fresh_token):
         """
         Тест ACTION без предварительного LOGIN (ожидается ошибка).
 
         Проверяет, что ACTION недоступен для токенов, не прошедших LOGIN.
         """
-        token = generate_hex_token(32)
+        response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
 
-        response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
+        expect_error(response)
 
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-        assert "message" in response
-
-    def test_logout_success(self, api_client):
+    def test_logout_success(self, api_client, fresh_token):
         """
         Тест успешного завершения сессии (LOGOUT).
 
@@ -104,98 +107,32 @@ class TestEndpointPositive:
         2. Отправить запрос LOGOUT
         3. Проверить успешный ответ
         """
-        token = generate_hex_token(32)
-
         # Сначала LOGIN, чтобы токен был в системе
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         # LOGIN может не пройти, если mock не настроен, но это не критично для LOGOUT
 
         # Затем LOGOUT
-        response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+        response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
 
         # LOGOUT должен работать даже для незалогиненных токенов (просто удаляет из хранилища)
         # Но если токен был залогинен, должен вернуть OK
         if response.get("result") == "OK":
-            SuccessResponse(**response)
+            expect_ok(response)
         else:
             # Если токен не был найден, это тоже валидное поведение
-            ErrorResponse(**response)
-            assert "message" in response
-
-    def test_invalid_token_format(self, api_client):
-        """
-        Тест с невалидным форматом токена.
-
-        Проверяет валидацию токена (должен быть 32 символа A-Z0-9).
-        """
-        # Токен неправильной длины
-        short_token = generate_hex_token(31)
-        response = api_client.endpoint(token=short_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-        # Токен с недопустимыми символами
-        invalid_token = "0123456789abcdef0123456789abcdef"  # содержит строчные буквы
-        response = api_client.endpoint(token=invalid_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_invalid_action(self, api_client):
-        """
-        Тест с невалидным действием.
-
-        Проверяет валидацию действия (должно быть LOGIN, ACTION или LOGOUT).
-        """
-        token = generate_hex_token(32)
-
-        response = api_client.endpoint(token=token, action="INVALID", validate_response=False)
-
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_missing_api_key(self, api_client):
-        """
-        Тест запроса без API ключа.
+            expect_error(response)
 
-        Проверяет, что запрос без заголовка X-Api-Key отклоняется.
-        """
-        import requests
-
-        token = generate_hex_token(32)
-        url = f"{api_client.base_url}/endpoint"
-        data = {"token": token, "action": "LOGIN"}
-
-        # Запрос без API ключа
-        response = requests.post(
-            url,
-            data=data,
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            timeout=api_client.timeout
-        )
-
-        # Ожидаем ошибку авторизации
-        assert response.status_code in [401, 403]
-
-    def test_wrong_api_key(self, config):
+    def test_wrong_api_key(self, api_client_wrong_key, fresh_token):
         """
         Тест запроса с неправильным API ключом.
 
         Проверяет, что запрос с неверным X-Api-Key отклоняется.
         """
-        from src.test_framework.clients.api_client import ApiClient
-
-        token = generate_hex_token(32)
-        wrong_client = ApiClient(
-            base_url=config["app"]["base_url"],
-            api_key="wrong_key",
-            timeout=config["app"].get("timeout", 30)
-        )
-
-        response = wrong_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        response = api_client_wrong_key.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
 
         # Может быть ошибка или 401/403
         if response.get("result") == "ERROR":
-            ErrorResponse(**response)
+            expect_error(response)
 
 
 @pytest.mark.api
@@ -203,215 +140,154 @@ class TestEndpointPositive:
 class TestEndpointNegative:
     """Негативные тесты для основного эндпоинта приложения."""
 
-    def test_empty_token(self, api_client):
-        """Тест с пустым токеном."""
-        response = api_client.endpoint(token="", action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_none_token(self, api_client):
-        """Тест с None токеном."""
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        data = {"token": None, "action": "LOGIN"}
-        response = requests.post(
-            url,
-            data=data,
-            headers=api_client.session.headers,
-            timeout=api_client.timeout
-        )
-        assert response.status_code in [400, 422, 500]
-
-    def test_very_long_token(self, api_client):
-        """Тест с очень длинным токеном."""
-        long_token = generate_hex_token(100)
-        response = api_client.endpoint(token=long_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_token_with_special_chars(self, api_client):
-        """Тест токена со спецсимволами."""
-        invalid_token = "0123456789abcdef0123456789@#$%"
-        response = api_client.endpoint(token=invalid_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_empty_action(self, api_client):
-        """Тест с пустым действием."""
-        token = generate_hex_token(32)
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        data = {"token": token, "action": ""}
-        response = requests.post(
-            url,
-            data=data,
-            headers=api_client.session.headers,
-            timeout=api_client.timeout
-        )
-        assert response.status_code in [400, 422]
-
-    def test_missing_action_parameter(self, api_client):
-        """Тест без параметра action."""
-        token = generate_hex_token(32)
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        data = {"token": token}
-        response = requests.post(
-            url,
-            data=data,
-            headers=api_client.session.headers,
-            timeout=api_client.timeout
-        )
-        assert response.status_code in [400, 422]
-
-    def test_missing_token_parameter(self, api_client):
-        """Тест без параметра token."""
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        data = {"action": "LOGIN"}
-        response = requests.post(
-            url,
-            data=data,
-            headers=api_client.session.headers,
-            timeout=api_client.timeout
-        )
-        assert response.status_code in [400, 422]
-
-    def test_lowercase_action(self, api_client):
-        """Тест с действием в нижнем регистре."""
-        token = generate_hex_token(32)
-        response = api_client.endpoint(token=token, action="login", validate_response=False)
+    # expected: "ERROR" - ответ обязан быть ошибкой, None - допустим любой результат
+    INVALID_INPUTS = [
+        pytest.param(generate_hex_token(31), "LOGIN", "ERROR", id="short_token"),
+        pytest.param(LOWERCASE_TOKEN, "LOGIN", "ERROR", id="lowercase_token"),
+        pytest.param("", "LOGIN", "ERROR", id="empty_token"),
+        pytest.param(generate_hex_token(100), "LOGIN", "ERROR", id="long_token"),
+        pytest.param(SPECIAL_CHARS_TOKEN, "LOGIN", "ERROR", id="special_chars"),
+        pytest.param(WHITESPACE_TOKEN, "LOGIN", "ERROR", id="whitespace_token"),
+        pytest.param(SQLI_TOKEN, "LOGIN", "ERROR", id="sqli"),
+        pytest.param(XSS_TOKEN, "LOGIN", "ERROR", id="xss"),
+        pytest.param(generate_hex_token(32), "INVALID", "ERROR", id="bad_action"),
         # Может быть OK (если система нечувствительна к регистру) или ERROR
-        assert "result" in response
-
-    def test_mixed_case_action(self, api_client):
-        """Тест с действием в смешанном регистре."""
-        token = generate_hex_token(32)
-        response = api_client.endpoint(token=token, action="LogIn", validate_response=False)
-        assert "result" in response
-
-    def test_whitespace_in_token(self, api_client):
-        """Тест токена с пробелами."""
-        token_with_spaces = "0123456789ABCDEF0123456789ABCDEF "
-        response = api_client.endpoint(token=token_with_spaces, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_whitespace_in_action(self, api_client):
-        """Тест действия с пробелами."""
-        token = generate_hex_token(32)
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        data = {"token": token, "action": " LOGIN "}
-        response = requests.post(
-            url,
-            data=data,
-            headers=api_client.session.headers,
-            timeout=api_client.timeout
+        pytest.param(generate_hex_token(32), "login", None, id="lowercase_action"),
+        pytest.param(generate_hex_token(32), "LogIn", None, id="mixed_case_action"),
+    ]
+
+    @pytest.mark.parametrize("token,action,expected", INVALID_INPUTS)
+    def test_rejects_invalid_input(self, api_client, token, action, expected):
+        """
+        Тест с невалидным токеном или действием.
+
+        Проверяет валидацию токена (32 символа A-Z0-9) и действия
+        (LOGIN, ACTION или LOGOUT).
+        """
+        response = api_client.endpoint(token=token, action=action, validate_response=False)
+        if expected is None:
+            assert "result" in response
+        else:
+            expect_error(response)
+
+    # send_token: передавать ли токен; action=None - параметр не передается
+    MALFORMED_REQUESTS = [
+        pytest.param(False, "LOGIN", True, {400, 422}, id="missing_token"),
+        pytest.param(True, None, True, {400, 422}, id="missing_action"),
+        pytest.param(True, "", True, {400, 422}, id="empty_action"),
+        pytest.param(True, " LOGIN ", True, {200, 400, 422}, id="whitespace_action"),
+        pytest.param(True, "LOGIN", False, {401, 403}, id="missing_api_key"),
+    ]
+
+    @pytest.mark.parametrize("send_token,action,with_api_key,expected", MALFORMED_REQUESTS)
+    def test_rejects_malformed_request(
+        self, api_client, fresh_token, send_token, action, with_api_key, expected
+    ):
+        """
+        Тест запроса с отсутствующими или пустыми параметрами.
+
+        Проверяет HTTP статус ответа на запрос без token, без action,
+        с пустым action, с пробелами в action и без заголовка X-Api-Key.
+        """
+        request = api_client.build_endpoint_request(
+            token=fresh_token if send_token else None, action=action
         )
-        assert response.status_code in [200, 400, 422]
-
-    def test_sql_injection_in_token(self, api_client):
-        """Тест на защиту от SQL инъекций в токене."""
-        sql_injection_token = "'; DROP TABLE tokens; --"
-        response = api_client.endpoint(token=sql_injection_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_xss_in_token(self, api_client):
-        """Тест на защиту от XSS в токене."""
-        xss_token = "<script>alert('xss')</script>"
-        response = api_client.endpoint(token=xss_token, action="LOGIN", validate_response=False)
-        assert response["result"] == "ERROR"
-        ErrorResponse(**response)
-
-    def test_timeout_handling(self, api_client):
+        if not with_api_key:
+            del request.headers["X-Api-Key"]
+        response = api_client.session.send(request)
+        assert response.status_code in expected
+
+    @pytest.mark.slow
+    def test_timeout_handling(self, api_client_short_timeout, token_factory):
         """Тест обработки таймаута при обращении к внешнему сервису."""
-        from src.test_framework.clients.api_client import ApiClient
-        from src.test_framework.fixtures.token import generate_hex_token
-        import requests
-        
-        # Создаем клиент с коротким таймаутом
-        short_timeout_client = ApiClient(
-            base_url=api_client.base_url,
-            api_key=api_client.api_key,
-            timeout=5
-        )
-        timeout_token = "TIMEOUT" + generate_hex_token(25)  # Всего 32 символа
+        timeout_token = "TIMEOUT" + token_factory(25)  # Всего 32 символа
         try:
-            response = short_timeout_client.endpoint(token=timeout_token, action="LOGIN", validate_response=False)
-            assert response["result"] == "ERROR"
-            ErrorResponse(**response)
-        except requests.exceptions.Timeout:
+            response = api_client_short_timeout.endpoint(token=timeout_token, action="LOGIN", validate_response=False)
+            expect_error(response)
+        except httpx.TimeoutException:
             # Ожидаемый таймаут
             pass
 
-    def test_duplicate_login(self, api_client):
+    def test_duplicate_login(self, api_client, fresh_token):
         """Тест повторного LOGIN без LOGOUT."""
-        token = generate_hex_token(32)
-        login1 = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login1 = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login1.get("result") == "OK":
             # Попытка повторного LOGIN
-            login2 = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+            login2 = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
             # Может быть OK (если система перезаписывает) или ERROR
             assert "result" in login2
 
-    def test_action_after_logout(self, api_client):
+    def test_action_after_logout(self, api_client, logged_in_token):
         """Тест ACTION после LOGOUT."""
-        token = generate_hex_token(32)
-        # LOGIN
-        login = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-        if login.get("result") == "OK":
-            # LOGOUT
-            logout = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
-            if logout.get("result") == "OK":
-                # ACTION после LOGOUT должен не работать
-                action = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-                assert action["result"] == "ERROR"
-                ErrorResponse(**action)
-
-    def test_logout_twice(self, api_client):
+        logout = api_client.endpoint(token=logged_in_token, action="LOGOUT", validate_response=False)
+        if logout.get("result") == "OK":
+            # ACTION после LOGOUT должен не работать
+            action = api_client.endpoint(token=logged_in_token, action="ACTION", validate_response=False)
+            expect_error(action)
+
+    def test_logout_twice(self, api_client, fresh_token):
         """Тест двойного LOGOUT."""
-        token = generate_hex_token(32)
-        login = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login.get("result") == "OK":
-            logout1 = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
-            logout2 = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+            logout1 = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
+            logout2 = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
             # Второй LOGOUT может вернуть ERROR или OK в зависимости от реализации
             assert "result" in logout2
 
-    def test_wrong_content_type(self, api_client):
+    def test_wrong_content_type(self, api_client, fresh_token):
         """Тест с неправильным Content-Type."""
-        token = generate_hex_token(32)
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        response = requests.post(
-            url,
-            json={"token": token, "action": "LOGIN"},
-            headers={
-                "X-Api-Key": api_client.api_key,
-                "Content-Type": "application/json",
-                "Accept": "application/json"
-            },
-            timeout=api_client.timeout
+        response = api_client.session.post(
+            "/endpoint",
+            content=json_body(fresh_token, "LOGIN"),
+            headers={"Content-Type": "application/json"}
         )
         # Может быть 415 (Unsupported Media Type) или другая ошибка
         assert response.status_code in [400, 415, 422, 500]
 
-    def test_wrong_accept_header(self, api_client):
+    def test_wrong_accept_header(self, api_client, fresh_token):
         """Тест с неправильным Accept заголовком."""
-        token = generate_hex_token(32)
-        import requests
-        url = f"{api_client.base_url}/endpoint"
-        response = requests.post(
-            url,
-            data={"token": token, "action": "LOGIN"},
-            headers={
-                "X-Api-Key": api_client.api_key,
-                "Content-Type": "application/x-www-form-urlencoded",
-                "Accept": "text/html"
-            },
-            timeout=api_client.timeout
-        )
+        request = api_client.build_endpoint_request(token=fresh_token, action="LOGIN")
+        request.headers["Accept"] = "text/html"
+        response = api_client.session.send(request)
         # Может быть 406 (Not Acceptable) или другая ошибка
         assert response.status_code in [200, 400, 406, 500]
+
+
+@pytest.mark.api
+@pytest.mark.pure_validation
+class TestEndpointClientValidation:
+    """Проверки невалидных входных данных без обращения к серверу."""
+
+    # Те же пары (token, action), что и в TestEndpointNegative, без ожидаемого результата
+    SENT_INPUTS = [
+        pytest.param(*case.values[:2], id=case.id)
+        for case in TestEndpointNegative.INVALID_INPUTS
+    ]
+
+    @pytest.mark.parametrize("token,action", SENT_INPUTS)
+    def test_invalid_input_sent_verbatim(self, mocked_api_client, mocked_endpoint, token, action):
+        """
+        Тест передачи невалидных данных клиентом.
+
+        Проверяет, что клиент отправляет ровно одно тело
+        application/x-www-form-urlencoded с токеном и действием без искажений
+        и возвращает ответ сервера с ошибкой как есть.
+        """
+        response = mocked_api_client.endpoint(token=token, action=action)
+        assert len(mocked_endpoint) == 1
+        request = mocked_endpoint[0]
+        assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+        assert request.content == urlencode({"token": token, "action": action}).encode("ascii")
+        expect_error(response)
+
+    def test_generated_tokens_match_success_stub(self, fresh_token, token_factory):
+        """
+        Тест формата токенов, которые выдают фикстуры.
+
+        Проверяет, что токены fresh_token и token_factory (с префиксом воркера
+        xdist) подходят под шаблон стаба WireMock для успешного /auth.
+        """
+        stub = json.loads(AUTH_SUCCESS_STUB.read_text(encoding="utf-8"))
+        pattern = stub["request"]["bodyPatterns"][0]["matches"]
+        for token in (fresh_token, token_factory(32)):
+            assert re.fullmatch(pattern, f"token={token}"), token
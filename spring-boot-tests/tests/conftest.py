@@ -0,0 +1,165 @@
+"""
+Общая конфигурация для всех тестов.
+
+Здесь определены фикстуры, общие для всех каталогов тестов: конфигурация,
+клиенты API поверх общего пула соединений и токены воркера xdist.
+В conftest.py каталогов остаются только фикстуры, нужные одному каталогу.
+"""
+import copy
+import httpx
+import os
+import pytest
+import yaml
+from functools import cache, partial
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from src.test_framework.clients.api_client import ApiClient, make_transport
+from src.test_framework.fixtures.token import iter_hex_tokens, make_token
+
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+@cache
+def _load_config_cached(path_str: str, mtime_ns: int) -> dict:
+    """Парсит YAML один раз для каждой пары (путь, mtime файла)."""
+    with open(path_str, encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_config() -> dict:
+    """Загружает конфигурацию из local.yaml."""
+    config_path = Path(__file__).parent.parent / "config" / "environments" / "local.yaml"
+    # Копия нужна, чтобы переопределения ниже не попадали в кеш
+    config = copy.deepcopy(
+        _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
+    )
+    
+    # Переопределение URL для Docker окружения
+    if os.getenv("APP_URL"):
+        config["app"]["base_url"] = os.getenv("APP_URL")
+    if os.getenv("MOCK_URL"):
+        config["mock"]["base_url"] = os.getenv("MOCK_URL")
+    
+    return config
+
+
+@pytest.fixture(scope="session")
+def config() -> dict:
+    """Конфигурация тестового окружения."""
+    return load_config()
+
+
+@pytest.fixture(scope="session")
+def http_transport() -> Iterator[httpx.HTTPTransport]:
+    """Общий пул соединений для всех клиентов API в рамках сессии."""
+    transport = make_transport(max_connections=32, max_keepalive_connections=32)
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(scope="session")
+def http_session(http_transport: httpx.HTTPTransport) -> httpx.Client:
+    """
+    HTTP клиент для служебных запросов (WireMock admin) поверх общего пула соединений.
+
+    Клиент не закрывается отдельно: транспортом владеет фикстура http_transport.
+    """
+    return httpx.Client(transport=http_transport)
+
+
+def _make_client(
+    config: dict,
+    transport: httpx.BaseTransport,
+    api_key: Optional[str] = None,
+    timeout: Optional[int] = None
+) -> ApiClient:
+    """Создает клиент поверх общего пула соединений."""
+    app_config = config["app"]
+    return ApiClient(
+        base_url=app_config["base_url"],
+        api_key=api_key if api_key is not None else app_config["api_key"],
+        timeout=timeout if timeout is not None else app_config.get("timeout", 30),
+        transport=transport
+    )
+
+
+@pytest.fixture(scope="session")
+def api_client(config: dict, http_transport: httpx.HTTPTransport) -> Iterator[ApiClient]:
+    """Клиент для работы с Spring Boot API."""
+    client = _make_client(config, http_transport)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def api_client_wrong_key(config: dict, http_transport: httpx.HTTPTransport) -> Iterator[ApiClient]:
+    """Клиент с неверным API ключом."""
+    client = _make_client(config, http_transport, api_key="wrong_key")
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def api_client_short_timeout(config: dict, http_transport: httpx.HTTPTransport) -> Iterator[ApiClient]:
+    """Клиент с коротким таймаутом для сценариев с медленным внешним сервисом."""
+    client = _make_client(config, http_transport, timeout=5)
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def worker_token_prefix(worker_id: str) -> str:
+    """
+    Hex префикс токенов текущего воркера xdist ("00", "01", ... или "FF" без xdist).
+
+    Токены разных воркеров не пересекаются, поэтому состояние LOGIN/LOGOUT
+    каждого токена меняет только один воркер. Префикс состоит из символов 0-9A-F,
+    чтобы токены подходили под стабы WireMock (token=[0-9A-F]{32}).
+    """
+    if worker_id == "master":
+        return "FF"
+    # worker_id воркера xdist имеет вид "gw<номер>"
+    return f"{int(worker_id[2:]):02X}"
+
+
+@pytest.fixture(scope="session")
+def token_factory(worker_token_prefix: str) -> Callable[[int], str]:
+    """Генератор случайных токенов заданной длины с префиксом воркера."""
+    return partial(make_token, worker_token_prefix)
+
+
+@pytest.fixture(scope="session")
+def token_pool(worker_token_prefix: str) -> Iterator[str]:
+    """Источник уникальных валидных токенов воркера на всю сессию."""
+    return iter_hex_tokens(32, prefix=worker_token_prefix)
+
+
+@pytest.fixture
+def fresh_token(token_pool: Iterator[str]) -> str:
+    """Уникальный валидный токен для одного теста."""
+    return next(token_pool)
+
+
+@pytest.fixture(scope="session")
+def mock_base_url(config: dict) -> str:
+    """Базовый URL mock-сервиса."""
+    return config["mock"]["base_url"]
+
+
+@pytest.fixture(scope="session")
+def wiremock_available(mock_base_url: str, http_session: httpx.Client) -> bool:
+    """
+    Проверяет доступность WireMock один раз на сессию (на каждый воркер xdist).
+
+    Выполняется один запрос к /__admin/ с коротким таймаутом: этот адрес есть
+    во всех версиях WireMock, в отличие от /__admin/health.
+    """
+    admin_url = f"{mock_base_url.rstrip('/')}/__admin/"
+    try:
+        return http_session.get(admin_url, timeout=0.5).status_code == 200
+    except httpx.HTTPError:
+        return False
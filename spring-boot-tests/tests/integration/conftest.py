@@ -1,46 +1,114 @@
 """
 Конфигурация для интеграционных тестов.
+
+Общие фикстуры (config, api_client, fresh_token и др.) определены в tests/conftest.py.
 """
+import collections
+import contextlib
+import httpx
 import pytest
-import yaml
-from pathlib import Path
+import pytest_asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Deque, Iterator, List
 from src.test_framework.clients.api_client import ApiClient
 
 
-def load_config() -> dict:
-    """Загружает конфигурацию из local.yaml."""
-    import os
-    config_path = Path(__file__).parent.parent.parent / "config" / "environments" / "local.yaml"
-    with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
-    
-    # Переопределение URL для Docker окружения
-    if os.getenv("APP_URL"):
-        config["app"]["base_url"] = os.getenv("APP_URL")
-    if os.getenv("MOCK_URL"):
-        config["mock"]["base_url"] = os.getenv("MOCK_URL")
-    
-    return config
-
-
-@pytest.fixture(scope="session")
-def config() -> dict:
-    """Конфигурация тестового окружения."""
-    return load_config()
-
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def api_client_async(config: dict) -> AsyncIterator[ApiClient]:
+    """
+    Клиент для параллельных запросов к Spring Boot API через asyncio.
 
-@pytest.fixture(scope="session")
-def api_client(config: dict) -> ApiClient:
-    """Клиент для работы с Spring Boot API."""
+    Использует один цикл событий на всю сессию, поэтому тесты с этой фикстурой
+    помечаются как @pytest.mark.asyncio(loop_scope="session").
+    """
     app_config = config["app"]
-    return ApiClient(
+    client = ApiClient(
         base_url=app_config["base_url"],
         api_key=app_config["api_key"],
         timeout=app_config.get("timeout", 30)
     )
+    yield client
+    await client.aclose()
+    client.close()
 
 
 @pytest.fixture(scope="session")
-def mock_base_url(config: dict) -> str:
-    """Базовый URL mock-сервиса."""
-    return config["mock"]["base_url"]
+def error_token(token_factory: Callable[[int], str]) -> str:
+    """Токен с префиксом ERROR: WireMock отвечает на его /doAction ошибкой."""
+    return "ERROR" + token_factory(27)
+
+
+@pytest.fixture(scope="session")
+def warm_tokens(api_client: ApiClient) -> Iterator[Deque[str]]:
+    """
+    Пул токенов, уже прошедших LOGIN, на всю сессию (на каждый воркер xdist).
+
+    Пул пополняется лениво фикстурой logged_in; после сессии для всех
+    токенов пула выполняется LOGOUT.
+    """
+    tokens: Deque[str] = collections.deque()
+    yield tokens
+    for token in tokens:
+        with contextlib.suppress(httpx.HTTPError):
+            api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+
+
+@pytest.fixture
+def logged_in(
+    request: pytest.FixtureRequest,
+    api_client: ApiClient,
+    warm_tokens: Deque[str],
+    token_pool: Iterator[str]
+) -> Iterator[str]:
+    """
+    Залогиненный токен из пула warm_tokens на время одного теста.
+
+    LOGIN выполняется только при пустом пуле; если он не прошел, тест пропускается.
+    Тест не должен делать LOGOUT для этого токена: после успешного теста
+    токен возвращается в пул, иначе для него выполняется LOGOUT, чтобы
+    следующие тесты не получили токен в неизвестном состоянии.
+    """
+    if warm_tokens:
+        token = warm_tokens.popleft()
+    else:
+        token = next(token_pool)
+        response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        if response.get("result") != "OK":
+            pytest.skip(f"LOGIN не прошел: {response}")
+    yield token
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        warm_tokens.append(token)
+    else:
+        with contextlib.suppress(httpx.HTTPError):
+            api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+
+
+@pytest.fixture
+def session_tokens(api_client: ApiClient) -> Iterator[List[str]]:
+    """
+    Токены, для которых после теста выполняется LOGOUT.
+
+    Тест добавляет в список токены, для которых делает LOGIN;
+    LOGOUT выполняется и при падении теста.
+    """
+    tokens: List[str] = []
+    yield tokens
+    for token in tokens:
+        with contextlib.suppress(httpx.HTTPError):
+            api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+
+
+@pytest.fixture(scope="session")
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Общий пул потоков для тестов с параллельными запросами."""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        yield pool
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    """Сохраняет отчет каждой фазы теста в item.rep_<фаза> для фикстуры logged_in."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
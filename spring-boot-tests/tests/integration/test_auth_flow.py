@@ -7,15 +7,15 @@
 - Интеграция с внешним сервисом через WireMock
 """
 import pytest
-from src.test_framework.fixtures.token import generate_hex_token
-from src.test_framework.models.response import SuccessResponse, ErrorResponse
+from src.test_framework.models.response import expect_ok, expect_error
 
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("auth_flow")
 class TestAuthFlow:
     """Интеграционные тесты для полного цикла работы с токенами."""
 
-    def test_full_cycle_login_action_logout(self, api_client):
+    def test_full_cycle_login_action_logout(self, api_client, fresh_token):
         """
         Тест полного цикла: LOGIN -> ACTION -> LOGOUT.
 
@@ -25,99 +25,86 @@ class TestAuthFlow:
         3. Завершение сессии через LOGOUT
         4. Проверка, что после LOGOUT токен больше не работает
         """
-        token = generate_hex_token(32)
-
         # Шаг 1: LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-        assert login_response["result"] == "OK", f"LOGIN failed: {login_response}"
-        SuccessResponse(**login_response)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
+        expect_ok(login_response)
 
         # Шаг 2: ACTION (должен работать после LOGIN)
-        action_response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action_response["result"] == "OK", f"ACTION failed after LOGIN: {action_response}"
-        SuccessResponse(**action_response)
+        action_response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
+        expect_ok(action_response)
 
         # Шаг 3: LOGOUT
-        logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
-        assert logout_response["result"] == "OK", f"LOGOUT failed: {logout_response}"
-        SuccessResponse(**logout_response)
+        logout_response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
+        expect_ok(logout_response)
 
         # Шаг 4: Проверка, что после LOGOUT ACTION больше не работает
-        action_after_logout = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action_after_logout["result"] == "ERROR", "ACTION should fail after LOGOUT"
-        ErrorResponse(**action_after_logout)
-        assert "message" in action_after_logout
+        action_after_logout = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
+        expect_error(action_after_logout)
 
-    def test_multiple_actions_after_login(self, api_client):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_actions_after_login(self, api_client_async, fresh_token):
         """
         Тест выполнения нескольких ACTION после одного LOGIN.
 
         Проверяет, что токен остается активным для нескольких действий.
+        ACTION не зависят друг от друга, поэтому отправляются параллельно;
+        LOGIN и LOGOUT выполняются последовательно до и после них.
         """
-        token = generate_hex_token(32)
-
         # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-        assert login_response["result"] == "OK"
-
-        # Первое ACTION
-        action1 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action1["result"] == "OK"
-
-        # Второе ACTION
-        action2 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action2["result"] == "OK"
-
-        # Третье ACTION
-        action3 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action3["result"] == "OK"
+        login_response = await api_client_async.endpoint_async(
+            token=fresh_token, action="LOGIN", validate_response=False
+        )
+        expect_ok(login_response)
+
+        # Три ACTION одновременно
+        actions = await api_client_async.endpoint_batch(
+            [(fresh_token, "ACTION")] * 3, validate_response=False
+        )
+        for action in actions:
+            assert action["result"] == "OK"
 
         # LOGOUT
-        logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
-        assert logout_response["result"] == "OK"
+        logout_response = await api_client_async.endpoint_async(
+            token=fresh_token, action="LOGOUT", validate_response=False
+        )
+        expect_ok(logout_response)
 
-    def test_action_without_login_fails(self, api_client):
+    def test_action_without_login_fails(self, api_client, fresh_token):
         """
         Тест, что ACTION не работает без предварительного LOGIN.
 
         Проверяет бизнес-логику: ACTION доступен только для залогиненных токенов.
         """
-        token = generate_hex_token(32)
-
         # Попытка ACTION без LOGIN
-        action_response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert action_response["result"] == "ERROR"
-        ErrorResponse(**action_response)
-        assert "message" in action_response
+        action_response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
+        expect_error(action_response)
 
-    def test_logout_without_login(self, api_client):
+    def test_logout_without_login(self, api_client, fresh_token):
         """
         Тест LOGOUT для незалогиненных токенов.
 
         Проверяет поведение LOGOUT без предварительного LOGIN.
         Может вернуть OK (если токен удаляется) или ERROR (если токен не найден).
         """
-        token = generate_hex_token(32)
-
         # LOGOUT без предварительного LOGIN
-        logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+        logout_response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
         
         # LOGOUT может вернуть OK или ERROR в зависимости от реализации
         if logout_response["result"] == "OK":
-            SuccessResponse(**logout_response)
+            expect_ok(logout_response)
         else:
             # Если токен не найден, это тоже валидное поведение
-            ErrorResponse(**logout_response)
-            assert "message" in logout_response
+            expect_error(logout_response)
 
-    def test_different_tokens_independence(self, api_client):
+    def test_different_tokens_independence(self, api_client, token_factory, session_tokens):
         """
         Тест независимости разных токенов.
 
         Проверяет, что токены работают независимо друг от друга.
         """
-        token1 = generate_hex_token(32)
-        token2 = generate_hex_token(32)
+        token1 = token_factory(32)
+        token2 = token_factory(32)
+        session_tokens.extend([token1, token2])
 
         # LOGIN для token1
         login1 = api_client.endpoint(token=token1, action="LOGIN", validate_response=False)
@@ -143,30 +130,28 @@ class TestAuthFlow:
         action1_again = api_client.endpoint(token=token1, action="ACTION", validate_response=False)
         assert action1_again["result"] == "OK"
 
-    def test_re_login_after_logout(self, api_client):
+    def test_re_login_after_logout(self, api_client, fresh_token):
         """
         Тест повторного LOGIN после LOGOUT.
 
         Проверяет, что после LOGOUT можно снова выполнить LOGIN.
         """
-        token = generate_hex_token(32)
-
         # Первый цикл: LOGIN -> ACTION -> LOGOUT
-        login1 = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login1 = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         assert login1["result"] == "OK"
 
-        action1 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
+        action1 = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
         assert action1["result"] == "OK"
 
-        logout1 = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+        logout1 = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
         assert logout1["result"] == "OK"
 
         # Второй цикл: повторный LOGIN -> ACTION -> LOGOUT
-        login2 = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login2 = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         assert login2["result"] == "OK"
 
-        action2 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
+        action2 = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
         assert action2["result"] == "OK"
 
-        logout2 = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+        logout2 = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
         assert logout2["result"] == "OK"
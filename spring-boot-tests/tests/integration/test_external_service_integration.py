@@ -7,72 +7,71 @@
 - Проверка состояния приложения при ошибках внешнего сервиса
 """
 import pytest
-import requests
-from src.test_framework.fixtures.token import generate_hex_token
-from src.test_framework.models.response import SuccessResponse, ErrorResponse
+from src.test_framework.models.response import expect_ok, expect_error
+
+
+def _do_action(client_and_token):
+    """Выполнить ACTION для пары (клиент, токен); удобно для executor.map."""
+    client, token = client_and_token
+    return client.endpoint(token=token, action="ACTION", validate_response=False)
 
 
 @pytest.mark.integration
 class TestExternalServiceIntegration:
     """Интеграционные тесты для взаимодействия с внешним сервисом."""
 
-    def test_login_success_with_mock_service(self, api_client, mock_base_url):
+    def test_login_success_with_mock_service(self, api_client, wiremock_available, fresh_token, session_tokens):
         """
         Тест успешного LOGIN при работе внешнего сервиса.
 
         Проверяет, что при успешном ответе от /auth приложение корректно обрабатывает токен.
         """
-        token = generate_hex_token(32)
-
-        # Проверяем, что WireMock доступен
-        try:
-            mock_status = requests.get(f"{mock_base_url}/__admin/", timeout=5)
-            assert mock_status.status_code == 200, "WireMock должен быть доступен"
-        except requests.exceptions.RequestException:
+        if not wiremock_available:
             pytest.skip("WireMock недоступен для тестирования")
+        session_tokens.append(fresh_token)
 
         # LOGIN должен работать, если mock настроен правильно
-        response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
 
         # Может быть OK, если mock настроен, или ERROR, если нет
         if response.get("result") == "OK":
-            SuccessResponse(**response)
+            expect_ok(response)
         else:
             # Если mock не настроен, это тоже валидное поведение
-            ErrorResponse(**response)
+            expect_error(response)
 
-    def test_action_requires_external_service(self, api_client, mock_base_url):
+    def test_action_requires_external_service(self, api_client, mock_base_url, fresh_token, session_tokens):
         """
         Тест, что ACTION требует работы внешнего сервиса /doAction.
 
         Проверяет интеграцию с внешним сервисом при выполнении ACTION.
         """
-        token = generate_hex_token(32)
-
+        session_tokens.append(fresh_token)
         # Сначала LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login_response.get("result") != "OK":
             pytest.skip("LOGIN не прошел, пропускаем тест")
 
         # ACTION должен обращаться к внешнему сервису
-        action_response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
+        action_response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
 
         # Может быть OK, если mock настроен, или ERROR
         if action_response.get("result") == "OK":
-            SuccessResponse(**action_response)
+            expect_ok(action_response)
         else:
-            ErrorResponse(**action_response)
+            expect_error(action_response)
 
-    def test_concurrent_tokens_with_external_service(self, api_client):
+    def test_concurrent_tokens_with_external_service(self, api_client, token_factory, session_tokens):
         """
         Тест работы нескольких токенов одновременно с внешним сервисом.
 
         Проверяет, что приложение корректно обрабатывает несколько токенов,
         каждый из которых обращается к внешнему сервису.
         """
-        token1 = generate_hex_token(32)
-        token2 = generate_hex_token(32)
-        token3 = generate_hex_token(32)
+        token1 = token_factory(32)
+        token2 = token_factory(32)
+        token3 = token_factory(32)
+        session_tokens.extend([token1, token2, token3])
 
         # LOGIN для всех токенов
         login1 = api_client.endpoint(token=token1, action="LOGIN", validate_response=False)
@@ -95,147 +94,108 @@ class TestExternalServiceIntegration:
                 action3 = api_client.endpoint(token=token3, action="ACTION", validate_response=False)
                 assert "result" in action3
 
-    def test_state_persistence_after_external_service_call(self, api_client):
+    def test_state_persistence_after_external_service_call(self, api_client, logged_in):
         """
         Тест сохранения состояния после обращения к внешнему сервису.
 
         Проверяет, что состояние токена сохраняется между запросами
-        после успешного обращения к внешнему сервису.
+        после успешного обращения к внешнему сервису. Залогиненный токен
+        берется из пула фикстуры logged_in.
         """
-        token = generate_hex_token(32)
+        # Несколько ACTION подряд (должны работать, так как токен все еще активен)
+        for _ in range(4):
+            action_response = api_client.endpoint(token=logged_in, action="ACTION", validate_response=False)
+            assert "result" in action_response
 
-        # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-        if login_response.get("result") != "OK":
-            pytest.skip("LOGIN не прошел")
-
-        # Первое ACTION
-        action1 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert "result" in action1
-
-        # Второе ACTION (должно работать, так как токен все еще активен)
-        action2 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert "result" in action2
-
-        # Третье ACTION
-        action3 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert "result" in action3
-
-        # Проверяем, что токен все еще активен
-        action4 = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        assert "result" in action4
-
-    def test_external_service_error_handling(self, api_client):
+    def test_external_service_error_handling(self, api_client, fresh_token, error_token, session_tokens):
         """
         Тест обработки ошибок внешнего сервиса.
         
         Проверяет, что приложение корректно обрабатывает ошибки от внешнего сервиса.
         """
-        token = generate_hex_token(32)
-        
+        session_tokens.append(fresh_token)
         # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login_response.get("result") != "OK":
             pytest.skip("LOGIN не прошел")
         
         # ACTION с токеном, который вызывает ошибку внешнего сервиса
-        error_token = "ERROR" + generate_hex_token(27)  # Всего 32 символа
+        session_tokens.append(error_token)
         error_login = api_client.endpoint(token=error_token, action="LOGIN", validate_response=False)
         if error_login.get("result") == "OK":
             error_action = api_client.endpoint(token=error_token, action="ACTION", validate_response=False)
             # Должна быть обработана ошибка от внешнего сервиса
             assert "result" in error_action
 
-    def test_concurrent_logins(self, api_client):
+    def test_concurrent_logins(self, api_client, token_factory, executor, session_tokens):
         """
         Тест параллельных LOGIN запросов.
         
         Проверяет обработку одновременных запросов на аутентификацию.
         """
-        import concurrent.futures
-        tokens = [generate_hex_token(32) for _ in range(10)]
+        tokens = [token_factory(32) for _ in range(10)]
+        session_tokens.extend(tokens)
         
         def login(token):
             return api_client.endpoint(token=token, action="LOGIN", validate_response=False)
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(login, tokens))
+        results = list(executor.map(login, tokens))
         
         # Проверяем, что все запросы обработаны
         assert len(results) == 10
         for result in results:
             assert "result" in result
 
-    def test_concurrent_actions(self, api_client):
+    def test_concurrent_actions(self, api_client, logged_in, executor):
         """
         Тест параллельных ACTION запросов.
         
         Проверяет обработку одновременных действий для одного токена.
+        Залогиненный токен берется из пула фикстуры logged_in.
         """
-        token = generate_hex_token(32)
-        
-        # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-        if login_response.get("result") != "OK":
-            pytest.skip("LOGIN не прошел")
-        
-        def perform_action():
-            return api_client.endpoint(token=token, action="ACTION", validate_response=False)
-        
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            results = list(executor.map(lambda _: perform_action(), range(5)))
+        results = list(executor.map(_do_action, [(api_client, logged_in)] * 5))
         
         # Проверяем результаты
         for result in results:
             assert "result" in result
 
-    def test_service_unavailable_handling(self, api_client, mock_base_url):
+    def test_service_unavailable_handling(self, api_client, wiremock_available, fresh_token):
         """
         Тест обработки недоступности внешнего сервиса.
         
         Проверяет поведение приложения, когда внешний сервис недоступен.
         """
-        import requests
-        token = generate_hex_token(32)
-        
-        # Проверяем доступность mock сервиса
-        try:
-            mock_status = requests.get(f"{mock_base_url}/__admin/", timeout=2)
-            if mock_status.status_code != 200:
-                pytest.skip("WireMock недоступен")
-        except requests.exceptions.RequestException:
-            # Если сервис недоступен, проверяем поведение
-            response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
-            assert response["result"] == "ERROR"
-            ErrorResponse(**response)
-
-    def test_race_condition_login_logout(self, api_client):
+        if wiremock_available:
+            pytest.skip("WireMock доступен, сценарий недоступности не воспроизводится")
+
+        # Внешний сервис недоступен: LOGIN должен завершиться ошибкой
+        response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
+        expect_error(response)
+
+    def test_race_condition_login_logout(self, api_client, fresh_token, executor, session_tokens):
         """
         Тест состояния гонки между LOGIN и LOGOUT.
         
         Проверяет корректность обработки одновременных LOGIN и LOGOUT.
         """
-        token = generate_hex_token(32)
-        
-        import concurrent.futures
+        session_tokens.append(fresh_token)
+
         def login():
-            return api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+            return api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         
         def logout():
-            return api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+            return api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
         
         # Сначала LOGIN
         login_response = login()
         if login_response.get("result") == "OK":
             # Параллельно выполняем LOGIN и LOGOUT
-            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-                futures = [
-                    executor.submit(login),
-                    executor.submit(logout)
-                ]
-                results = [f.result() for f in concurrent.futures.as_completed(futures)]
-            
+            futures = [
+                executor.submit(login),
+                executor.submit(logout)
+            ]
+            results = [f.result() for f in futures]
+
             # Проверяем, что все запросы обработаны
             for result in results:
                 assert "result" in result
@@ -3,9 +3,11 @@
 
 Тестирует обработку ошибок и граничных случаев в интеграционных сценариях.
 """
+import httpx
 import pytest
-from src.test_framework.fixtures.token import generate_hex_token
-from src.test_framework.models.response import ErrorResponse
+from src.test_framework.models.response import expect_error
+
+INVALID_TOKEN = "INVALID_TOKEN_123456789012345"
 
 
 @pytest.mark.integration
@@ -19,119 +21,97 @@ class TestIntegrationNegative:
         
         Проверяет обработку невалидного токена на всех этапах.
         """
-        invalid_token = "INVALID_TOKEN_123456789012345"
-        
         # LOGIN с невалидным токеном
-        login_response = api_client.endpoint(token=invalid_token, action="LOGIN", validate_response=False)
-        assert login_response["result"] == "ERROR"
-        ErrorResponse(**login_response)
+        login_response = api_client.endpoint(token=INVALID_TOKEN, action="LOGIN", validate_response=False)
+        expect_error(login_response)
         
         # ACTION с невалидным токеном
-        action_response = api_client.endpoint(token=invalid_token, action="ACTION", validate_response=False)
-        assert action_response["result"] == "ERROR"
-        ErrorResponse(**action_response)
+        action_response = api_client.endpoint(token=INVALID_TOKEN, action="ACTION", validate_response=False)
+        expect_error(action_response)
         
         # LOGOUT с невалидным токеном (может работать или нет)
-        logout_response = api_client.endpoint(token=invalid_token, action="LOGOUT", validate_response=False)
+        logout_response = api_client.endpoint(token=INVALID_TOKEN, action="LOGOUT", validate_response=False)
         assert "result" in logout_response
 
-    def test_action_with_expired_session(self, api_client):
+    def test_action_with_expired_session(self, api_client, fresh_token):
         """
         Тест ACTION после истечения сессии.
         
         Проверяет поведение при попытке выполнить ACTION после истечения сессии.
         """
-        token = generate_hex_token(32)
-        
         # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login_response.get("result") == "OK":
             # LOGOUT
-            logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+            logout_response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
             if logout_response.get("result") == "OK":
                 # ACTION после LOGOUT должен не работать
-                action_response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-                assert action_response["result"] == "ERROR"
-                ErrorResponse(**action_response)
+                action_response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
+                expect_error(action_response)
 
-    def test_mixed_valid_invalid_tokens(self, api_client):
+    def test_mixed_valid_invalid_tokens(self, api_client, token_factory, session_tokens):
         """
         Тест смешения валидных и невалидных токенов.
         
         Проверяет, что невалидные токены не влияют на валидные.
         """
-        valid_token = generate_hex_token(32)
-        invalid_token = "INVALID_TOKEN_123456789012345"
-        
+        valid_token = token_factory(32)
+        session_tokens.append(valid_token)
+
         # LOGIN валидного токена
         valid_login = api_client.endpoint(token=valid_token, action="LOGIN", validate_response=False)
         if valid_login.get("result") == "OK":
             # ACTION с невалидным токеном
-            invalid_action = api_client.endpoint(token=invalid_token, action="ACTION", validate_response=False)
+            invalid_action = api_client.endpoint(token=INVALID_TOKEN, action="ACTION", validate_response=False)
             assert invalid_action["result"] == "ERROR"
             
             # ACTION с валидным токеном все еще должен работать
             valid_action = api_client.endpoint(token=valid_token, action="ACTION", validate_response=False)
             assert valid_action["result"] == "OK"
 
-    def test_external_service_timeout_impact(self, api_client):
+    @pytest.mark.slow
+    def test_external_service_timeout_impact(self, api_client_short_timeout, token_factory):
         """
         Тест влияния таймаута внешнего сервиса.
         
         Проверяет поведение при таймауте внешнего сервиса.
         """
-        from src.test_framework.clients.api_client import ApiClient
-        import requests
-        
-        # Создаем клиент с коротким таймаутом
-        short_timeout_client = ApiClient(
-            base_url=api_client.base_url,
-            api_key=api_client.api_key,
-            timeout=5
-        )
-        
-        timeout_token = "TIMEOUT" + generate_hex_token(25)
+        timeout_token = "TIMEOUT" + token_factory(25)
         
         try:
-            response = short_timeout_client.endpoint(token=timeout_token, action="LOGIN", validate_response=False)
-            assert response["result"] == "ERROR"
-            ErrorResponse(**response)
-        except requests.exceptions.Timeout:
+            response = api_client_short_timeout.endpoint(token=timeout_token, action="LOGIN", validate_response=False)
+            expect_error(response)
+        except httpx.TimeoutException:
             # Ожидаемый таймаут
             pass
 
-    def test_rapid_login_logout_cycle(self, api_client):
+    def test_rapid_login_logout_cycle(self, api_client, fresh_token):
         """
         Тест быстрого цикла LOGIN-LOGOUT.
         
         Проверяет стабильность при частых переключениях состояний токена.
         """
-        token = generate_hex_token(32)
-        
         # Выполняем несколько циклов быстро
-        for i in range(5):
-            login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        for _ in range(5):
+            login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
             assert "result" in login_response
             
-            logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+            logout_response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
             assert "result" in logout_response
 
-    def test_multiple_actions_after_single_logout(self, api_client):
+    def test_multiple_actions_after_single_logout(self, api_client, fresh_token):
         """
         Тест множественных ACTION после одного LOGOUT.
         
         Проверяет, что после LOGOUT все последующие ACTION не работают.
         """
-        token = generate_hex_token(32)
-        
         # LOGIN
-        login_response = api_client.endpoint(token=token, action="LOGIN", validate_response=False)
+        login_response = api_client.endpoint(token=fresh_token, action="LOGIN", validate_response=False)
         if login_response.get("result") == "OK":
             # LOGOUT
-            logout_response = api_client.endpoint(token=token, action="LOGOUT", validate_response=False)
+            logout_response = api_client.endpoint(token=fresh_token, action="LOGOUT", validate_response=False)
             if logout_response.get("result") == "OK":
                 # Несколько ACTION после LOGOUT
-                for i in range(3):
-                    action_response = api_client.endpoint(token=token, action="ACTION", validate_response=False)
-                    assert action_response["result"] == "ERROR"
-                    ErrorResponse(**action_response)
+                for _ in range(3):
+                    action_response = api_client.endpoint(token=fresh_token, action="ACTION", validate_response=False)
+                    expect_error(action_response)
@@ -3,20 +3,37 @@
 
 Тестирует производительность эндпоинта /endpoint при различных нагрузках.
 """
-import random
-import string
-from locust import HttpUser, task, between, events
+import os
+import secrets
+from functools import lru_cache
+from locust import FastHttpUser, HttpUser, task, between, events
 import yaml
 from pathlib import Path
 
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+@lru_cache(maxsize=1)
 def load_config() -> dict:
-    """Загружает конфигурацию из local.yaml."""
-    import os
+    """
+    Загружает конфигурацию из local.yaml.
+
+    Конфигурация читается один раз на процесс и общая для всех пользователей,
+    поэтому изменять возвращаемый словарь нельзя.
+    """
     # Путь относительно locustfile.py: tests/performance/locustfile.py -> spring-boot-tests/config/...
     config_path = Path(__file__).parent.parent.parent / "config" / "environments" / "local.yaml"
     with open(config_path, encoding="utf-8") as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     
     # Переопределение URL для Docker окружения
     if os.getenv("APP_URL"):
@@ -27,8 +44,53 @@ def load_config() -> dict:
 
 def generate_token(length: int = 32) -> str:
     """Генерирует токен заданной длины из символов 0-9A-F."""
-    characters = string.digits + "ABCDEF"
-    return "".join(random.choice(characters) for _ in range(length))
+    # Один вызов secrets.token_hex вместо цикла random.choice по символам
+    return secrets.token_hex((length + 1) // 2)[:length].upper()
+
+
+INVALID_TOKEN = "INVALID_TOKEN_123456789012345"
+
+# Параметры окружения фиксируются при загрузке модуля, поэтому пользователи
+# не обращаются ни к конфигурации, ни к переменным окружения
+_CONFIG = load_config()
+API_KEY = _CONFIG["app"]["api_key"]
+# Хост по умолчанию; параметр --host командной строки имеет приоритет
+BASE_URL = _CONFIG["app"]["base_url"]
+
+# Заголовки одинаковы для всех пользователей: словарь создается один раз
+# при загрузке модуля и не должен изменяться
+_BASE_HEADERS = {
+    "Content-Type": "application/x-www-form-urlencoded",
+    "Accept": "application/json",
+    "X-Api-Key": API_KEY,
+}
+
+
+def _check_result(response, expected: str = "OK") -> bool:
+    """
+    Отмечает ответ успешным, если поле result совпадает с ожидаемым.
+
+    Args:
+        response: Ответ, полученный с catch_response=True
+        expected: Ожидаемое значение поля result
+
+    Returns:
+        True, если ответ отмечен успешным
+    """
+    if response.status_code != 200:
+        response.failure(f"HTTP {response.status_code}")
+        return False
+    try:
+        result = json_loads(response.content)
+        actual = result.get("result")
+    except Exception as e:
+        response.failure(f"Invalid response: {e}")
+        return False
+    if actual != expected:
+        response.failure(f"Expected {expected}, got: {result}")
+        return False
+    response.success()
+    return True
 
 
 class SpringBootUser(HttpUser):
@@ -41,17 +103,12 @@ class SpringBootUser(HttpUser):
     - LOGOUT для завершения сессии
     """
     wait_time = between(1, 3)  # Ожидание между запросами 1-3 секунды
+    host = BASE_URL
+    headers = _BASE_HEADERS
     
     def on_start(self):
         """Инициализация пользователя при старте."""
-        config = load_config()
-        self.api_key = config["app"]["api_key"]
         self.token = generate_token(32)
-        self.headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "X-Api-Key": self.api_key,
-        }
         # Выполняем LOGIN при старте
         self.login()
     
@@ -59,22 +116,12 @@ class SpringBootUser(HttpUser):
         """Выполняет LOGIN для получения доступа."""
         with self.client.post(
             "/endpoint",
-            data={"token": self.token, "action": "LOGIN"},
+            data=f"token={self.token}&action=LOGIN",
             headers=self.headers,
             catch_response=True,
             name="LOGIN"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "OK":
-                        response.success()
-                    else:
-                        response.failure(f"LOGIN failed: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            _check_result(response)
     
     @task(3)
     def perform_action(self):
@@ -85,22 +132,12 @@ class SpringBootUser(HttpUser):
         """
         with self.client.post(
             "/endpoint",
-            data={"token": self.token, "action": "ACTION"},
+            data=f"token={self.token}&action=ACTION",
             headers=self.headers,
             catch_response=True,
             name="ACTION"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "OK":
-                        response.success()
-                    else:
-                        response.failure(f"ACTION failed: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            _check_result(response)
     
     @task(1)
     def logout(self):
@@ -111,25 +148,15 @@ class SpringBootUser(HttpUser):
         """
         with self.client.post(
             "/endpoint",
-            data={"token": self.token, "action": "LOGOUT"},
+            data=f"token={self.token}&action=LOGOUT",
             headers=self.headers,
             catch_response=True,
             name="LOGOUT"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "OK":
-                        response.success()
-                        # После LOGOUT генерируем новый токен и делаем LOGIN
-                        self.token = generate_token(32)
-                        self.login()
-                    else:
-                        response.failure(f"LOGOUT failed: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            if _check_result(response):
+                # После LOGOUT генерируем новый токен и делаем LOGIN
+                self.token = generate_token(32)
+                self.login()
 
 
 @events.test_start.add_listener
@@ -158,39 +185,20 @@ class SpringBootNegativeUser(HttpUser):
     - Запросы без авторизации
     """
     wait_time = between(0.5, 2)  # Более быстрое выполнение для негативных тестов
-    
-    def on_start(self):
-        """Инициализация пользователя при старте."""
-        config = load_config()
-        self.api_key = config["app"]["api_key"]
-        self.headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "X-Api-Key": self.api_key,
-        }
+    host = BASE_URL
+    headers = _BASE_HEADERS
     
     @task(5)
     def test_invalid_token(self):
         """Тест с невалидным токеном."""
-        invalid_token = "INVALID_TOKEN_123456789012345"
         with self.client.post(
             "/endpoint",
-            data={"token": invalid_token, "action": "LOGIN"},
+            data=f"token={INVALID_TOKEN}&action=LOGIN",
             headers=self.headers,
             catch_response=True,
             name="LOGIN_INVALID_TOKEN"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "ERROR":
-                        response.success()
-                    else:
-                        response.failure(f"Expected ERROR, got: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            _check_result(response, "ERROR")
     
     @task(3)
     def test_action_without_login(self):
@@ -198,22 +206,12 @@ class SpringBootNegativeUser(HttpUser):
         token = generate_token(32)
         with self.client.post(
             "/endpoint",
-            data={"token": token, "action": "ACTION"},
+            data=f"token={token}&action=ACTION",
             headers=self.headers,
             catch_response=True,
             name="ACTION_WITHOUT_LOGIN"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "ERROR":
-                        response.success()
-                    else:
-                        response.failure(f"Expected ERROR, got: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            _check_result(response, "ERROR")
     
     @task(2)
     def test_invalid_action(self):
@@ -221,56 +219,45 @@ class SpringBootNegativeUser(HttpUser):
         token = generate_token(32)
         with self.client.post(
             "/endpoint",
-            data={"token": token, "action": "INVALID_ACTION"},
+            data=f"token={token}&action=INVALID_ACTION",
             headers=self.headers,
             catch_response=True,
             name="INVALID_ACTION"
         ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "ERROR":
-                        response.success()
-                    else:
-                        response.failure(f"Expected ERROR, got: {result}")
-                except Exception as e:
-                    response.failure(f"Invalid response: {e}")
-            else:
-                response.failure(f"HTTP {response.status_code}")
+            _check_result(response, "ERROR")
 
 
-class SpringBootSpikeUser(HttpUser):
+class SpringBootSpikeUser(FastHttpUser):
     """
     Пользователь для тестирования скачков нагрузки.
     
     Симулирует резкие изменения нагрузки на систему.
+    Использует FastHttpUser (geventhttpclient), чтобы один процесс Locust
+    создавал больше запросов.
     """
     wait_time = between(0.1, 0.5)  # Очень быстрое выполнение
+    host = BASE_URL
+    headers = _BASE_HEADERS
     
     def on_start(self):
         """Инициализация пользователя при старте."""
-        config = load_config()
-        self.api_key = config["app"]["api_key"]
+        # Метод клиента сохраняется в атрибут, чтобы не искать его на каждой задаче
+        self._post = self.client.post
         self.token = generate_token(32)
-        self.headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "X-Api-Key": self.api_key,
-        }
         self.login()
     
     def login(self):
         """Выполняет LOGIN."""
         with self.client.post(
             "/endpoint",
-            data={"token": self.token, "action": "LOGIN"},
+            data=f"token={self.token}&action=LOGIN",
             headers=self.headers,
             catch_response=True,
             name="LOGIN_SPIKE"
         ) as response:
             if response.status_code == 200:
                 try:
-                    result = response.json()
+                    result = json_loads(response.content)
                     if result.get("result") == "OK":
                         response.success()
                 except Exception:
@@ -279,66 +266,54 @@ class SpringBootSpikeUser(HttpUser):
     @task(10)
     def perform_action_spike(self):
         """Выполняет ACTION с высокой частотой."""
-        with self.client.post(
+        # Успех определяется по HTTP статусу: разбор JSON на этом пути
+        # не влиял на результат и только нагружал CPU генератора нагрузки
+        self._post(
             "/endpoint",
-            data={"token": self.token, "action": "ACTION"},
+            data=f"token={self.token}&action=ACTION",
             headers=self.headers,
-            catch_response=True,
             name="ACTION_SPIKE"
-        ) as response:
-            if response.status_code == 200:
-                try:
-                    result = response.json()
-                    if result.get("result") == "OK":
-                        response.success()
-                except Exception:
-                    pass
+        )
 
 
-class SpringBootStressUser(HttpUser):
+class SpringBootStressUser(FastHttpUser):
     """
     Пользователь для стресс-тестирования.
     
     Симулирует максимальную нагрузку на систему.
+    Использует FastHttpUser (geventhttpclient), как и SpringBootSpikeUser.
     """
     wait_time = between(0.05, 0.2)  # Минимальные задержки
+    host = BASE_URL
+    headers = _BASE_HEADERS
     
     def on_start(self):
         """Инициализация пользователя при старте."""
-        config = load_config()
-        self.api_key = config["app"]["api_key"]
+        # Метод клиента сохраняется в атрибут, как и в SpringBootSpikeUser
+        self._post = self.client.post
         self.token = generate_token(32)
-        self.headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-            "X-Api-Key": self.api_key,
-        }
         # Не делаем LOGIN при старте для стресс-теста
     
     @task(3)
     def stress_login(self):
         """Стресс-тест LOGIN."""
         token = generate_token(32)
-        with self.client.post(
+        # Результат определяется по HTTP статусу, тело ответа не проверяется
+        self._post(
             "/endpoint",
-            data={"token": token, "action": "LOGIN"},
+            data=f"token={token}&action=LOGIN",
             headers=self.headers,
-            catch_response=True,
             name="STRESS_LOGIN"
-        ) as response:
-            if response.status_code == 200:
-                response.success()
+        )
     
     @task(7)
     def stress_action(self):
         """Стресс-тест ACTION."""
         token = generate_token(32)
-        with self.client.post(
+        # Результат определяется по HTTP статусу, тело ответа не проверяется
+        self._post(
             "/endpoint",
-            data={"token": token, "action": "ACTION"},
+            data=f"token={token}&action=ACTION",
             headers=self.headers,
-            catch_response=True,
             name="STRESS_ACTION"
-        ) as response:
-            if response.status_code == 200:
-                response.success()
+        )